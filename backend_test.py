@@ -5,10 +5,82 @@ Tests all CRUD operations, authentication, AI features, and data persistence
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import sys
 import json
+import os
+import time
+import base64
+import threading
+import functools
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Concurrently running tests; the connection pool is sized to match so no worker waits on a socket
+MAX_WORKERS = 8
+
+# Registered test user is reused across runs while its JWT is still valid
+TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/oyun_tester/token.json")
+
+# Read timeouts in seconds by endpoint prefix: short for plain reads, long for the AI endpoints
+READ_TIMEOUTS = {
+    'categories': 5,
+    'auth/register': 10,
+    'ai/assist': 45,
+    'ai/explain': 45,
+    'reviews': 10
+}
+DEFAULT_READ_TIMEOUT = 15
+# Connection failures should surface immediately rather than wait out the read budget
+CONNECT_TIMEOUT = 3
+
+# Constant request payloads, serialized once at import instead of on every call
+REVIEW_CATEGORY = "Aksiyon"
+REVIEW_BODY = json.dumps({
+    "title": "Test Oyun İncelemesi",
+    "content": "Bu bir test incelemesidir. Oyun çok güzel ve eğlenceli. Grafikleri harika, oynanış akıcı.",
+    "game_name": "Test Game 2025",
+    "category": REVIEW_CATEGORY,
+    "tags": ["test", "aksiyon", "eğlenceli"]
+}).encode()
+UPDATED_REVIEW_TITLE = "Güncellenmiş Test İncelemesi"
+UPDATE_REVIEW_BODY = json.dumps({
+    "title": UPDATED_REVIEW_TITLE,
+    "content": "Bu içerik güncellendi. Yeni bilgiler eklendi."
+}).encode()
+COMMENT_BODY = json.dumps({"content": "Bu çok güzel bir inceleme! Teşekkürler."}).encode()
+AI_ASSIST_BODY = json.dumps({
+    "prompt": "Bu incelemeyi daha ilgi çekici hale getir",
+    "context": "Oyun çok güzel. Grafikleri iyi."
+}).encode()
+WORD_EXPLAIN_BODY = json.dumps({
+    "word": "peak yapmak",
+    "context": "Bu oyunda çok peak yaptım, gerçekten eğlenceliydi."
+}).encode()
+
+# A test and the names of the tests that must finish before it starts
+Node = namedtuple('Node', 'test deps')
+
+def requires_auth(name: str):
+    """Log a failed test without making any request when no token is available"""
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(self):
+            if not self.token:
+                return self.log_test(name, False, "- No authentication token")
+            return test(self)
+        return wrapper
+    return decorator
 
 class GameReviewAPITester:
     def __init__(self, base_url="https://oyun-yazarlari.preview.emergentagent.com"):
@@ -17,47 +89,93 @@ class GameReviewAPITester:
         self.token = None
         self.user_id = None
         self.username = None
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.test_review_id = None
+        self.test_email = None
+        # (name, success, details, elapsed) per test; list.append is atomic so no lock is needed
+        self.results: List[tuple[str, bool, str, float]] = []
+        # Result lines are written in one go at the end of the run instead of a print per test
+        self._log_buf: List[str] = []
+        # Read-only tests share one review while update/delete mutate the other, so both can run concurrently
+        self.test_review_id_ro = None
+        self.test_review_id_rw = None
         self.test_comment_id = None
+        self._categories_cache = None
+        self._local = threading.local()
+        self._url_prefix = f"{self.api_url}/"
+        self._auth_headers = None
+
+        # Reuse one keep-alive connection across all tests instead of a fresh TLS handshake per call
+        self.session = requests.Session()
+        # Retry transient connection errors and 429/502/503/504 with exponential backoff instead of failing the run.
+        # 500 is left out since the AI endpoints fail deterministically with it, and POST is only retried on
+        # connect errors (never sent) because POSTs here are not idempotent: likes toggle, reviews duplicate.
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=frozenset(['GET', 'PUT', 'DELETE']), raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=MAX_WORKERS))
+        # Ask for compressed bodies explicitly; only advertises br/zstd when a decoder is installed
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING
+        })
 
     def log_test(self, name: str, success: bool, details: str = ""):
         """Log test results"""
-        self.tests_run += 1
+        # Total time spent in requests made by this test's thread since its last result
+        elapsed = getattr(self._local, 'elapsed', 0.0)
+        self._local.elapsed = 0.0
+        self.results.append((name, success, details, elapsed))
         if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED {details}")
+            self._log_buf.append(f"✅ {name} - PASSED {details} ({elapsed:.2f}s)")
         else:
-            print(f"❌ {name} - FAILED {details}")
+            self._log_buf.append(f"❌ {name} - FAILED {details} ({elapsed:.2f}s)")
         return success
 
+    def log_skip(self, name: str, details: str = ""):
+        """Log a test that was not exercised; it does not count toward the results"""
+        self._local.elapsed = 0.0
+        self._log_buf.append(f"⏭️  {name} - SKIPPED {details}")
+
+    def run_dag(self, graph: Dict[str, Node]):
+        """Run each test as soon as all of its dependencies have finished"""
+        pending = dict(graph)
+        running = {}
+        done = set()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            while pending or running:
+                for name, node in list(pending.items()):
+                    if all(dep in done for dep in node.deps):
+                        running[executor.submit(node.test)] = name
+                        del pending[name]
+                if not running:
+                    raise ValueError(f"Unresolvable test dependencies: {sorted(pending)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+                    done.add(running.pop(future))
+
     def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                    expected_status: int = 200, auth_required: bool = False) -> tuple[bool, Dict]:
+                    expected_status: int = 200, auth_required: bool = False,
+                    raw_body: Optional[bytes] = None) -> tuple[bool, Dict]:
         """Make HTTP request with error handling"""
-        url = f"{self.api_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+        url = self._url_prefix + endpoint
+        headers = self._auth_headers if auth_required else None
         
-        if auth_required and self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            return False, {"error": f"Unsupported method: {method}"}
         
+        read_timeout = next((v for k, v in READ_TIMEOUTS.items() if endpoint.startswith(k)), DEFAULT_READ_TIMEOUT)
+        t0 = time.perf_counter()
+        response = None
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=30)
-            else:
-                return False, {"error": f"Unsupported method: {method}"}
+            # Stream and read the body once so it is not buffered again by response.content
+            response = self.session.request(method, url, data=raw_body, json=data, headers=headers,
+                                            timeout=(CONNECT_TIMEOUT, read_timeout), stream=True)
+            body = response.raw.read(decode_content=True)
 
             success = response.status_code == expected_status
             try:
-                response_data = response.json() if response.content else {}
-            except:
-                response_data = {"raw_response": response.text}
+                response_data = json_loads(body) if body else {}
+            except ValueError:
+                response_data = {"raw_response": body.decode('utf-8', errors='replace')}
             
             if not success:
                 response_data["status_code"] = response.status_code
@@ -65,12 +183,26 @@ class GameReviewAPITester:
                 
             return success, response_data
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+            # Errors while reading the raw stream come from urllib3 unwrapped
             return False, {"error": str(e)}
+        finally:
+            if response is not None:
+                response.close()
+            self._local.elapsed = getattr(self._local, 'elapsed', 0.0) + time.perf_counter() - t0
+
+    def get_categories(self) -> tuple[bool, Dict]:
+        """Fetch categories once per run; set _categories_cache to None to refetch"""
+        if self._categories_cache is None:
+            success, response = self.make_request('GET', 'categories')
+            if not success:
+                return success, response
+            self._categories_cache = response
+        return True, self._categories_cache
 
     def test_categories_endpoint(self):
         """Test categories endpoint"""
-        success, response = self.make_request('GET', 'categories')
+        success, response = self.get_categories()
         if success and 'categories' in response:
             categories = response['categories']
             expected_categories = ["Aksiyon", "RPG", "Strateji", "Macera", "Korku", "Simülasyon", "Spor", "Yarış", "Bulmaca", "Diğer"]
@@ -78,8 +210,75 @@ class GameReviewAPITester:
             return self.log_test("Categories Endpoint", has_expected, f"- Found {len(categories)} categories")
         return self.log_test("Categories Endpoint", False, f"- Response: {response}")
 
+    def set_token(self, token: str):
+        """Store the access token and build its Authorization header once"""
+        self.token = token
+        self._auth_headers = {'Authorization': f'Bearer {token}'}
+
+    def load_cached_token(self) -> bool:
+        """Reuse a previously registered user if its token has not expired"""
+        try:
+            with open(TOKEN_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached.get('base_url') != self.base_url:
+                return False
+            payload = cached['access_token'].split('.')[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+            if claims.get('exp', 0) <= time.time() + 60:
+                return False
+            token = cached['access_token']
+            user_id = cached['user_id']
+            username = cached['username']
+            email = cached.get('email')
+        except (OSError, ValueError, KeyError, IndexError, AttributeError, TypeError):
+            return False
+        self.set_token(token)
+        self.user_id = user_id
+        self.username = username
+        self.test_email = email
+        return True
+
+    def drop_cached_token(self):
+        """Forget a cached token the server no longer accepts"""
+        try:
+            os.remove(TOKEN_CACHE_PATH)
+        except OSError:
+            pass
+
+    def save_cached_token(self):
+        """Persist the registered user's token for later runs"""
+        try:
+            os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+            # Create the file owner-only so the bearer token is never readable by other users
+            fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # O_CREAT's mode does not apply to a file that already exists
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    "base_url": self.base_url,
+                    "access_token": self.token,
+                    "user_id": self.user_id,
+                    "username": self.username,
+                    "email": self.test_email
+                }, f)
+        except OSError:
+            pass
+
     def test_user_registration(self):
         """Test user registration"""
+        if self.load_cached_token():
+            # The server may have lost the user or rotated its key since the token was cached
+            success, response = self.make_request('GET', 'auth/me', auth_required=True)
+            if success and response.get('id') == self.user_id:
+                return self.log_skip("User Registration", f"- Reusing cached user: {self.username}")
+            if response.get('status_code') == 401:
+                self.drop_cached_token()
+            # Fall back to registering a fresh user; its timing should not include the check above
+            self.token = None
+            self._auth_headers = None
+            self.user_id = self.username = self.test_email = None
+            self._local.elapsed = 0.0
+        
         timestamp = datetime.now().strftime('%H%M%S')
         test_data = {
             "email": f"test_user_{timestamp}@example.com",
@@ -89,57 +288,58 @@ class GameReviewAPITester:
         
         success, response = self.make_request('POST', 'auth/register', test_data, 200)
         if success and 'access_token' in response and 'user' in response:
-            self.token = response['access_token']
+            self.set_token(response['access_token'])
             self.user_id = response['user']['id']
             self.username = response['user']['username']
+            self.test_email = test_data['email']
+            self.save_cached_token()
             return self.log_test("User Registration", True, f"- User: {self.username}")
         return self.log_test("User Registration", False, f"- Response: {response}")
 
     def test_user_login(self):
         """Test user login with existing credentials"""
-        if not self.username:
+        if not self.test_email:
             return self.log_test("User Login", False, "- No user to test login with")
             
-        # Try to login with the registered user
+        # Registered email with a wrong password must be rejected
         login_data = {
-            "email": f"test_user_{datetime.now().strftime('%H%M%S')}@example.com",
-            "password": "TestPass123!"
+            "email": self.test_email,
+            "password": "WrongPass!"
         }
         
-        # Since we can't use the exact same email, let's test with a known pattern
-        # This test will likely fail but shows the login endpoint works
         success, response = self.make_request('POST', 'auth/login', login_data, expected_status=401)
-        if response.get('status_code') == 401:
+        if success:
             return self.log_test("User Login", True, "- Login endpoint working (401 for invalid creds)")
         return self.log_test("User Login", False, f"- Response: {response}")
 
+    @requires_auth("Get Current User")
     def test_get_current_user(self):
         """Test getting current user info"""
-        if not self.token:
-            return self.log_test("Get Current User", False, "- No token available")
-            
         success, response = self.make_request('GET', 'auth/me', auth_required=True)
         if success and 'id' in response and 'username' in response:
             return self.log_test("Get Current User", True, f"- User: {response['username']}")
         return self.log_test("Get Current User", False, f"- Response: {response}")
 
+    @requires_auth("Create Review")
     def test_create_review(self):
         """Test creating a new review"""
-        if not self.token:
-            return self.log_test("Create Review", False, "- No authentication token")
-            
-        review_data = {
-            "title": "Test Oyun İncelemesi",
-            "content": "Bu bir test incelemesidir. Oyun çok güzel ve eğlenceli. Grafikleri harika, oynanış akıcı.",
-            "game_name": "Test Game 2025",
-            "category": "Aksiyon",
-            "tags": ["test", "aksiyon", "eğlenceli"]
-        }
+        success, response = self.get_categories()
+        if success and REVIEW_CATEGORY not in response.get('categories', []):
+            return self.log_test("Create Review", False, f"- Unknown category: {REVIEW_CATEGORY}")
         
-        success, response = self.make_request('POST', 'reviews', review_data, 200, auth_required=True)
-        if success and 'id' in response:
-            self.test_review_id = response['id']
-            return self.log_test("Create Review", True, f"- Review ID: {self.test_review_id}")
+        review_ids = []
+        for _ in range(2):
+            success, response = self.make_request('POST', 'reviews', expected_status=200, auth_required=True,
+                                                raw_body=REVIEW_BODY)
+            if not (success and 'id' in response):
+                break
+            review_ids.append(response['id'])
+        
+        if len(review_ids) == 2:
+            self.test_review_id_ro, self.test_review_id_rw = review_ids
+            return self.log_test("Create Review", True, f"- Review IDs: {', '.join(review_ids)}")
+        if review_ids:
+            self.test_review_id_ro = review_ids[0]
         return self.log_test("Create Review", False, f"- Response: {response}")
 
     def test_get_reviews(self):
@@ -158,39 +358,34 @@ class GameReviewAPITester:
 
     def test_get_single_review(self):
         """Test getting a single review"""
-        if not self.test_review_id:
+        if not self.test_review_id_ro:
             return self.log_test("Get Single Review", False, "- No review ID available")
             
-        success, response = self.make_request('GET', f'reviews/{self.test_review_id}')
+        success, response = self.make_request('GET', f'reviews/{self.test_review_id_ro}')
         if success and 'id' in response and 'title' in response:
             return self.log_test("Get Single Review", True, f"- Title: {response['title']}")
         return self.log_test("Get Single Review", False, f"- Response: {response}")
 
+    @requires_auth("Update Review")
     def test_update_review(self):
         """Test updating a review"""
-        if not self.test_review_id or not self.token:
-            return self.log_test("Update Review", False, "- Missing review ID or token")
+        if not self.test_review_id_rw:
+            return self.log_test("Update Review", False, "- No review ID available")
             
-        update_data = {
-            "title": "Güncellenmiş Test İncelemesi",
-            "content": "Bu içerik güncellendi. Yeni bilgiler eklendi."
-        }
-        
-        success, response = self.make_request('PUT', f'reviews/{self.test_review_id}', 
-                                            update_data, 200, auth_required=True)
-        if success and response.get('title') == update_data['title']:
+        success, response = self.make_request('PUT', f'reviews/{self.test_review_id_rw}', 
+                                            expected_status=200, auth_required=True, raw_body=UPDATE_REVIEW_BODY)
+        if success and response.get('title') == UPDATED_REVIEW_TITLE:
             return self.log_test("Update Review", True, "- Review updated successfully")
         return self.log_test("Update Review", False, f"- Response: {response}")
 
+    @requires_auth("Create Comment")
     def test_create_comment(self):
         """Test creating a comment on a review"""
-        if not self.test_review_id or not self.token:
-            return self.log_test("Create Comment", False, "- Missing review ID or token")
+        if not self.test_review_id_ro:
+            return self.log_test("Create Comment", False, "- No review ID available")
             
-        comment_data = {"content": "Bu çok güzel bir inceleme! Teşekkürler."}
-        
-        success, response = self.make_request('POST', f'reviews/{self.test_review_id}/comments',
-                                            comment_data, 200, auth_required=True)
+        success, response = self.make_request('POST', f'reviews/{self.test_review_id_ro}/comments',
+                                            expected_status=200, auth_required=True, raw_body=COMMENT_BODY)
         if success and 'id' in response:
             self.test_comment_id = response['id']
             return self.log_test("Create Comment", True, f"- Comment ID: {self.test_comment_id}")
@@ -198,31 +393,33 @@ class GameReviewAPITester:
 
     def test_get_comments(self):
         """Test getting comments for a review"""
-        if not self.test_review_id:
+        if not self.test_review_id_ro:
             return self.log_test("Get Comments", False, "- No review ID available")
             
-        success, response = self.make_request('GET', f'reviews/{self.test_review_id}/comments')
+        success, response = self.make_request('GET', f'reviews/{self.test_review_id_ro}/comments')
         if success and isinstance(response, list):
             return self.log_test("Get Comments", True, f"- Found {len(response)} comments")
         return self.log_test("Get Comments", False, f"- Response: {response}")
 
+    @requires_auth("Like Review")
     def test_like_review(self):
         """Test liking/unliking a review"""
-        if not self.test_review_id or not self.token:
-            return self.log_test("Like Review", False, "- Missing review ID or token")
+        if not self.test_review_id_ro:
+            return self.log_test("Like Review", False, "- No review ID available")
             
-        success, response = self.make_request('POST', f'reviews/{self.test_review_id}/like',
+        success, response = self.make_request('POST', f'reviews/{self.test_review_id_ro}/like',
                                             auth_required=True)
         if success and 'liked' in response:
             return self.log_test("Like Review", True, f"- Liked: {response['liked']}")
         return self.log_test("Like Review", False, f"- Response: {response}")
 
+    @requires_auth("Check Liked Status")
     def test_check_liked_status(self):
         """Test checking if review is liked"""
-        if not self.test_review_id or not self.token:
-            return self.log_test("Check Liked Status", False, "- Missing review ID or token")
+        if not self.test_review_id_ro:
+            return self.log_test("Check Liked Status", False, "- No review ID available")
             
-        success, response = self.make_request('GET', f'reviews/{self.test_review_id}/liked',
+        success, response = self.make_request('GET', f'reviews/{self.test_review_id_ro}/liked',
                                             auth_required=True)
         if success and 'liked' in response:
             return self.log_test("Check Liked Status", True, f"- Liked: {response['liked']}")
@@ -248,85 +445,95 @@ class GameReviewAPITester:
             return self.log_test("Get User Reviews", True, f"- Found {len(response)} user reviews")
         return self.log_test("Get User Reviews", False, f"- Response: {response}")
 
+    @requires_auth("AI Writing Assistant")
     def test_ai_writing_assistant(self):
         """Test AI writing assistant"""
-        if not self.token:
-            return self.log_test("AI Writing Assistant", False, "- No authentication token")
-            
-        ai_request = {
-            "prompt": "Bu incelemeyi daha ilgi çekici hale getir",
-            "context": "Oyun çok güzel. Grafikleri iyi."
-        }
-        
-        success, response = self.make_request('POST', 'ai/assist', ai_request, 200, auth_required=True)
+        success, response = self.make_request('POST', 'ai/assist', expected_status=200, auth_required=True,
+                                            raw_body=AI_ASSIST_BODY)
         if success and 'suggestion' in response and len(response['suggestion']) > 10:
             return self.log_test("AI Writing Assistant", True, f"- Got suggestion ({len(response['suggestion'])} chars)")
         return self.log_test("AI Writing Assistant", False, f"- Response: {response}")
 
     def test_ai_word_explanation(self):
         """Test AI word explanation feature"""
-        word_request = {
-            "word": "peak yapmak",
-            "context": "Bu oyunda çok peak yaptım, gerçekten eğlenceliydi."
-        }
-        
-        success, response = self.make_request('POST', 'ai/explain', word_request, 200)
+        success, response = self.make_request('POST', 'ai/explain', expected_status=200, raw_body=WORD_EXPLAIN_BODY)
         if success and 'explanation' in response and len(response['explanation']) > 10:
             return self.log_test("AI Word Explanation", True, f"- Got explanation ({len(response['explanation'])} chars)")
         return self.log_test("AI Word Explanation", False, f"- Response: {response}")
 
+    @requires_auth("Delete Review")
     def test_delete_review(self):
         """Test deleting a review (cleanup)"""
-        if not self.test_review_id or not self.token:
-            return self.log_test("Delete Review", False, "- Missing review ID or token")
+        if not self.test_review_id_rw:
+            return self.log_test("Delete Review", False, "- No review ID available")
             
-        success, response = self.make_request('DELETE', f'reviews/{self.test_review_id}',
+        success, response = self.make_request('DELETE', f'reviews/{self.test_review_id_rw}',
                                             expected_status=200, auth_required=True)
         if success and 'message' in response:
+            self.test_review_id_rw = None
             return self.log_test("Delete Review", True, "- Review deleted successfully")
         return self.log_test("Delete Review", False, f"- Response: {response}")
 
+    def cleanup_reviews(self):
+        """Delete whichever staged reviews still exist, including one test_delete_review failed to remove"""
+        for review_id in (self.test_review_id_ro, self.test_review_id_rw):
+            if review_id:
+                self.make_request('DELETE', f'reviews/{review_id}', auth_required=True)
+        self.test_review_id_ro = None
+        self.test_review_id_rw = None
+
+    def warm_up(self):
+        """Open a pooled connection with a throwaway request; the result is irrelevant"""
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.exceptions.RequestException:
+            pass
+
     def run_all_tests(self):
         """Run all backend tests"""
         print("🚀 Starting Backend API Tests for Oyun Yazarlari")
         print("=" * 60)
         
-        # Basic endpoints
-        self.test_categories_endpoint()
-        
-        # Authentication flow
-        self.test_user_registration()
-        self.test_user_login()
-        self.test_get_current_user()
+        # Open up to MAX_WORKERS pooled connections concurrently so the root tests of the graph,
+        # which all start at once, don't pay DNS + TLS inside their timings
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(lambda _: self.warm_up(), range(MAX_WORKERS)))
         
-        # Review CRUD operations
-        self.test_create_review()
-        self.test_get_reviews()
-        self.test_get_reviews_by_category()
-        self.test_get_single_review()
-        self.test_update_review()
-        
-        # Comments and likes
-        self.test_create_comment()
-        self.test_get_comments()
-        self.test_like_review()
-        self.test_check_liked_status()
-        
-        # User profile
-        self.test_get_user_profile()
-        self.test_get_user_reviews()
-        
-        # AI features
-        self.test_ai_writing_assistant()
-        self.test_ai_word_explanation()
+        # Reads, comments and likes use one review while update/delete mutate the other
+        graph = {
+            'categories': Node(self.test_categories_endpoint, []),
+            'ai_word_explanation': Node(self.test_ai_word_explanation, []),
+            'get_reviews': Node(self.test_get_reviews, []),
+            'get_reviews_by_category': Node(self.test_get_reviews_by_category, []),
+            'register': Node(self.test_user_registration, []),
+            'login': Node(self.test_user_login, ['register']),
+            'get_current_user': Node(self.test_get_current_user, ['register']),
+            'ai_writing_assistant': Node(self.test_ai_writing_assistant, ['register']),
+            'get_user_profile': Node(self.test_get_user_profile, ['register']),
+            'get_user_reviews': Node(self.test_get_user_reviews, ['register']),
+            'create_review': Node(self.test_create_review, ['register', 'categories']),
+            'get_single_review': Node(self.test_get_single_review, ['create_review']),
+            'create_comment': Node(self.test_create_comment, ['create_review']),
+            'get_comments': Node(self.test_get_comments, ['create_comment']),
+            'like_review': Node(self.test_like_review, ['create_review']),
+            'check_liked_status': Node(self.test_check_liked_status, ['like_review']),
+            'update_review': Node(self.test_update_review, ['create_review']),
+            'delete_review': Node(self.test_delete_review, ['update_review']),
+        }
         
-        # Cleanup
-        self.test_delete_review()
+        try:
+            self.run_dag(graph)
+        finally:
+            self.cleanup_reviews()
+            # Flush collected results even if a test raised
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
         
         # Results
         print("=" * 60)
-        print(f"📊 Test Results: {self.tests_passed}/{self.tests_run} tests passed")
-        success_rate = (self.tests_passed / self.tests_run) * 100 if self.tests_run > 0 else 0
+        tests_run = len(self.results)
+        tests_passed = sum(1 for result in self.results if result[1])
+        print(f"📊 Test Results: {tests_passed}/{tests_run} tests passed")
+        success_rate = (tests_passed / tests_run) * 100 if tests_run > 0 else 0
         print(f"📈 Success Rate: {success_rate:.1f}%")
         
         if success_rate >= 80: